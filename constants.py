@@ -0,0 +1,77 @@
+# -------------------- STYLES --------------------
+CSS = """
+<style>
+/* ---------- Title Center ---------- */
+.center-title {
+    text-align: center !important;
+    width: 100%;
+    display: block;
+    margin: auto;
+}
+
+/* ---------- Buttons ---------- */
+div.stButton > button {
+    width: 500px;         
+    height: 70px;
+    font-size: 20px;
+    font-weight: 600;
+    text-align: center;
+    border-radius: 15px;
+    margin: 15px;
+}
+
+/* Center the 4 buttons in a grid */
+.button-container {
+    display: flex;
+    justify-content: center;
+    flex-wrap: wrap;
+    gap: 20px;
+}
+
+/* ---------- Dropdown ---------- */
+div[data-baseweb="select"] {
+    height: 45px !important;
+    font-size: 18px !important;
+}
+div[data-baseweb="select"] > div {
+    height: 45px !important;
+    font-size: 18px !important;
+}
+
+/* ---------- Fix fog after download ---------- */
+[data-testid="stNotification"] {
+    opacity: 1 !important;
+    backdrop-filter: none !important;
+}
+</style>
+"""
+
+# -------------------- STOCK LIST --------------------
+nifty50 = {
+    "Reliance Industries": "RELIANCE.NS",
+    "TCS": "TCS.NS",
+    "Infosys": "INFY.NS",
+    "HDFC Bank": "HDFCBANK.NS",
+    "ICICI Bank": "ICICIBANK.NS",
+    "Bharti Airtel": "BHARTIARTL.NS",
+}
+
+sensex30 = {
+    "State Bank of India": "SBIN.BO",
+    "Tata Steel": "TATASTEEL.BO",
+    "Asian Paints": "ASIANPAINT.BO",
+    "Bajaj Finance": "BAJFINANCE.BO",
+    "HUL": "HINDUNILVR.BO",
+}
+
+nasdaq = {
+    "Apple": "AAPL",
+    "Microsoft": "MSFT",
+    "Google": "GOOGL",
+    "Amazon": "AMZN",
+    "Tesla": "TSLA",
+    "NVIDIA": "NVDA",
+}
+
+STOCK_OPTIONS = {**nifty50, **sensex30, **nasdaq}
+SELECT_OPTIONS = ("",) + tuple(STOCK_OPTIONS.keys()) + tuple(STOCK_OPTIONS.values())
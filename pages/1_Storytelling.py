@@ -1,5 +1,4 @@
 import streamlit as st
-import yfinance as yf
 
 ticker = st.session_state.get("selected_ticker", "AAPL")
 st.title(f"🎮 Storytelling Mode for {ticker}")
@@ -3,67 +3,107 @@ import yfinance as yf
 import plotly.graph_objects as go
 import pandas as pd
 from io import BytesIO
-import base64
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib import colors
 import subprocess
+import shutil
+import codecs
+import time
+import os
+import tempfile
+from pathlib import Path
 
 # -------------------- DATA FETCH --------------------
+HISTORY_TTL = 300
+# A disk hit is then held in memory for HISTORY_TTL, so prices shown can be
+# up to DISK_TTL + HISTORY_TTL (7.5 min) old
+DISK_TTL = HISTORY_TTL // 2
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+
+@st.cache_resource(max_entries=64)
+def get_ticker(symbol):
+    return yf.Ticker(symbol)
+
+@st.cache_data(ttl=HISTORY_TTL, show_spinner=False)
+def fetch_history(ticker):
+    # Raises on failure so that errors and empty replies are never cached
+    # Disk copy survives process restarts and is shared between workers
+    path = CACHE_DIR / f"{ticker}_6mo_1d.parquet"
+    try:
+        if path.stat().st_mtime > time.time() - DISK_TTL:
+            return pd.read_parquet(path)
+    except Exception:
+        pass
+
+    df = get_ticker(ticker).history(period="6mo", interval="1d")
+    if df.empty:
+        raise ValueError(f"No price data returned for {ticker}")
+    df.index = df.index.tz_localize(None)
+    df.reset_index(inplace=True)
+
+    # Write to a temp file and rename it into place so readers never see a partial file
+    tmp_path = None
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".parquet.tmp")
+        os.close(fd)
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return df
+
 def load_data(ticker):
     try:
-        df = yf.download(ticker, period="6mo", interval="1d")
-        if df.empty:
-            return pd.DataFrame()
-        df.reset_index(inplace=True)
-        return df
+        return fetch_history(ticker)
     except Exception:
         return pd.DataFrame()
 
 # -------------------- PLOTS --------------------
+@st.cache_data(ttl=HISTORY_TTL, max_entries=32, show_spinner=False)
 def price_chart(df, ticker):
     fig = go.Figure()
+    dates = df['Date'].to_numpy()
+    close = df['Close'].to_numpy()
 
     # OHLC chart
     fig.add_trace(go.Candlestick(
-        x=df['Date'], open=df['Open'], high=df['High'],
-        low=df['Low'], close=df['Close'], name="OHLC"
+        x=dates, open=df['Open'], high=df['High'],
+        low=df['Low'], close=close, name="OHLC"
     ))
 
     # 200-day MA
-    if len(df) > 200:
-        df['MA200'] = df['Close'].rolling(200).mean()
+    if len(close) > 200:
         fig.add_trace(go.Scatter(
-            x=df['Date'], y=df['MA200'], mode='lines',
+            x=dates, y=df['Close'].rolling(200).mean(), mode='lines',
             name="200 MA", line=dict(color="blue")
         ))
 
-    fig.update_layout(title=f"{ticker} Price Movement", xaxis_title="Date", yaxis_title="Price")
+    fig.update_layout(title=f"{ticker} Price Movement", xaxis_title="Date", yaxis_title="Price", uirevision=ticker)
     return fig
 
+@st.cache_data(ttl=HISTORY_TTL, max_entries=32, show_spinner=False)
 def volume_chart(df, ticker):
     fig = go.Figure()
     fig.add_trace(go.Bar(x=df['Date'], y=df['Volume'], name="Volume", marker_color="orange"))
-    fig.update_layout(title=f"{ticker} Volume Trends", xaxis_title="Date", yaxis_title="Volume")
+    fig.update_layout(title=f"{ticker} Volume Trends", xaxis_title="Date", yaxis_title="Volume", uirevision=ticker)
     return fig
 
 # -------------------- EXPORTS --------------------
-def create_excel(df, ticker):
-    buffer = BytesIO()
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Stock Data")
-    return buffer
+def _fmt_price(x):
+    return f"{x:,.2f}" if isinstance(x, (int, float)) else "N/A"
 
-def create_pdf(ticker, df, ai_text):
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
-
-    story.append(Paragraph(f"Stock Report: {ticker}", styles["Title"]))
-    story.append(Spacer(1, 12))
+def _fmt_short(x):
+    if not isinstance(x, (int, float)):
+        return "N/A"
+    for unit, scale in (("T", 1e12), ("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        if abs(x) >= scale:
+            return f"{x / scale:.2f}{unit}"
+    return f"{x:.0f}"
 
+def summary_stats(df):
     # Safe stats
     try:
         latest_close = float(df['Close'].iloc[-1])
@@ -75,10 +115,51 @@ def create_pdf(ticker, df, ai_text):
     except Exception:
         avg_volume = "N/A"
 
+    return {"latest_close": latest_close, "avg_volume": avg_volume}
+
+@st.cache_data(ttl=HISTORY_TTL, max_entries=32, show_spinner=False)
+def create_excel(df, ticker):
+    import xlsxwriter
+
+    buffer = BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {"in_memory": True})
+    sheet = workbook.add_worksheet("Stock Data")
+    header_fmt = workbook.add_format({"bold": True})
+    date_fmt = workbook.add_format({"num_format": "yyyy-mm-dd"})
+
+    # One write_column per column instead of pandas' per-cell adapter
+    sheet.write_row(0, 0, list(df.columns), header_fmt)
+    for col_idx, col in enumerate(df.columns):
+        values = df[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            sheet.write_column(1, col_idx, [ts.to_pydatetime() for ts in values], date_fmt)
+        else:
+            # None leaves the cell blank, matching to_excel's default na_rep=""
+            sheet.write_column(1, col_idx, values.astype(object).where(values.notna(), None).tolist())
+
+    workbook.close()
+    return buffer.getvalue()
+
+@st.cache_data(ttl=HISTORY_TTL, max_entries=32, show_spinner=False)
+def create_pdf(ticker, summary, ai_text):
+    # ReportLab is only needed when a report is (re)built
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib import colors
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    story = []
+
+    story.append(Paragraph(f"Stock Report: {ticker}", styles["Title"]))
+    story.append(Spacer(1, 12))
+
     stats = [
         ["Metric", "Value"],
-        ["Latest Close", latest_close],
-        ["Average Volume", avg_volume],
+        ["Latest Close", _fmt_price(summary["latest_close"])],
+        ["Average Volume", _fmt_short(summary["avg_volume"])],
     ]
 
     table = Table(stats)
@@ -95,18 +176,67 @@ def create_pdf(ticker, df, ai_text):
     story.append(Paragraph(ai_text, styles["Normal"]))
 
     doc.build(story)
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
 
 # -------------------- AI SUMMARY --------------------
-def get_ai_summary(ticker, df):
+AI_SUMMARY_TTL = 900
+AI_PROMPT = "Summarize stock performance for {ticker} in 3-4 sentences."
+AI_UNAVAILABLE = "AI summary not available (Ollama not installed)."
+
+@st.cache_resource
+def get_summary_store():
+    # ticker -> (created_at, text); shared by all sessions in this process
+    return {}
+
+def cached_ai_summary(ticker):
+    entry = get_summary_store().get(ticker)
+    if entry and entry[0] > time.time() - AI_SUMMARY_TTL:
+        return entry[1]
+    return None
+
+def ollama_available():
+    if "_ollama_ok" not in st.session_state:
+        st.session_state["_ollama_ok"] = shutil.which("ollama") is not None
+    return st.session_state["_ollama_ok"]
+
+def start_ai_summary(ticker):
+    if not ollama_available():
+        return None
+
+    try:
+        proc = subprocess.Popen(
+            ["ollama", "run", "llama3"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+    except Exception:
+        return None
+
     try:
-        subprocess.run(["ollama", "--version"], check=True, capture_output=True)
-        prompt = f"Summarize stock performance for {ticker} in 3-4 sentences."
-        result = subprocess.run(["ollama", "run", "llama3"], input=prompt.encode(), capture_output=True)
-        return result.stdout.decode().strip()
+        proc.stdin.write(AI_PROMPT.format(ticker=ticker).encode())
+        proc.stdin.close()
+        return proc
     except Exception:
-        return "AI summary not available (Ollama not installed)."
+        stop_ai_summary(proc)
+        return None
+
+def stop_ai_summary(proc):
+    if proc.poll() is None:
+        proc.kill()
+    proc.wait()
+
+def stream_ai_summary(proc):
+    if proc is None:
+        yield AI_UNAVAILABLE
+        return
+
+    # Yield output as Ollama produces it rather than waiting for the full reply
+    # A rerun mid-stream abandons the generator, so always reap the child
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    try:
+        for chunk in iter(lambda: proc.stdout.read1(1024), b""):
+            yield decoder.decode(chunk)
+    finally:
+        stop_ai_summary(proc)
 
 # -------------------- MAIN APP --------------------
 def main():
@@ -119,29 +249,41 @@ def main():
     ticker = st.session_state["selected_ticker"]
     st.subheader(f"Showing analysis for: {ticker}")
 
-    df = load_data(ticker)
+    # Ollama doesn't need the price data, so let it run while Yahoo is fetched
+    ai_text = cached_ai_summary(ticker)
+    ai_proc = start_ai_summary(ticker) if ai_text is None else None
+    # A rerun or error before the stream finishes must not leave llama3 running
+    try:
+        df = load_data(ticker)
 
-    if df.empty:
-        st.error("No data found for this ticker. Try another one.")
-        return
+        if df.empty:
+            st.error("No data found for this ticker. Try another one.")
+            return
 
-    # Charts
-    st.plotly_chart(price_chart(df, ticker), use_container_width=True)
-    st.plotly_chart(volume_chart(df, ticker), use_container_width=True)
+        # Charts
+        st.plotly_chart(price_chart(df, ticker), use_container_width=True)
+        st.plotly_chart(volume_chart(df, ticker), use_container_width=True)
 
-    # AI Summary
-    ai_text = get_ai_summary(ticker, df)
-    st.subheader("🤖 AI Summary")
-    st.write(ai_text)
+        # AI Summary
+        st.subheader("🤖 AI Summary")
+        if ai_text is not None:
+            st.write(ai_text)
+        else:
+            ai_text = st.write_stream(stream_ai_summary(ai_proc)).strip()
+            if ai_proc is not None and ai_proc.returncode == 0:
+                get_summary_store()[ticker] = (time.time(), ai_text)
+    finally:
+        if ai_proc is not None:
+            stop_ai_summary(ai_proc)
 
     # Downloads
     st.subheader("📥 Export Data")
 
-    excel_buffer = create_excel(df, ticker)
-    st.download_button("Download Excel", data=excel_buffer, file_name=f"{ticker}_data.xlsx")
+    excel_bytes = create_excel(df, ticker)
+    st.download_button("Download Excel", data=excel_bytes, file_name=f"{ticker}_data.xlsx")
 
-    pdf_buffer = create_pdf(ticker, df, ai_text)
-    st.download_button("Download PDF", data=pdf_buffer, file_name=f"{ticker}_report.pdf")
+    pdf_bytes = create_pdf(ticker, summary_stats(df), ai_text)
+    st.download_button("Download PDF", data=pdf_bytes, file_name=f"{ticker}_report.pdf")
 
 if __name__ == "__main__":
     main()